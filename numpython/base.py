@@ -1,31 +1,168 @@
 from __future__ import annotations
 
-import random
+import weakref
 from typing import Any, Sequence
 import numpy as np
+from numpy.typing import DTypeLike
+
+_SHAPE_ERROR = "All rows must have the same length and be non-empty."
+
+_rng = np.random.default_rng()
+
+# dtypes the Generator can sample directly, without a float64 round trip.
+_GENERATOR_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+def seed(value: int | None = None) -> None:
+    """
+    Reseed the generator used by Pymatrix.random and Pymatrix.randn.
+
+    Parameters
+    ----------
+    value : int | None
+        Seed for a new np.random.Generator; None draws fresh entropy.
+    """
+    global _rng
+    _rng = np.random.default_rng(value)
 
 class Pymatrix:
     """
     A simple matrix class with basic operations.
+
+    The values are kept in ``data``, whose memory order is reported by
+    ``_layout``: "C" (row-major) or "F" (column-major) when the data is
+    contiguous in that order, None for strided views such as ``m[:, ::2]``.
+    Transposing flips the layout instead of moving memory.
+
+    Transposes and submatrices are views of the matrix they come from and
+    behave as independent copies: when the source is modified in place the
+    live views copy their data first, and a view modified in place copies
+    its own. Rows and columns are plain ndarray views of this matrix.
+
+    Values are float64 unless another ``dtype`` is requested. float32
+    halves the memory footprint and doubles the SIMD width, at the cost of
+    about 7 significant digits instead of 16.
     """
-    def __init__(self, data: list[list[float]]):
+    __slots__ = ("data", "rows", "cols", "shape", "_aliases", "__weakref__")
+
+    def __init__(
+            self, data: Sequence[Sequence[float]] | np.ndarray, dtype: DTypeLike = np.float64
+            ):
         """
         Initialize a Pymatrix from a 2D list.
 
         Parameters
         ----------
-        data : list[list[float]]
+        data : Sequence[Sequence[float]] | np.ndarray
             A non-empty list of lists with equal-length rows.
+            Rows given as ``array.array('d')`` are read through the buffer
+            protocol without boxing each value.
+        dtype : DTypeLike
+            Element type of the underlying np.ndarray.
+
+        Raises
+        ------
+        ValueError
+            If the rows are ragged or empty, or a value is not numeric.
+        TypeError
+            If a value is None or not convertible to dtype.
         """
-        if not data or not all(len(row) == len(data[0]) for row in data):
-            raise ValueError("All rows must have the same length and be non-empty.")
-        self.data = data
-        self.rows = len(data)
-        self.cols = len(data[0])
+        try:
+            array = np.asarray(data, dtype=dtype)
+        except (TypeError, ValueError) as exc:
+            # Ragged rows fail even without a dtype, bad values do not.
+            try:
+                np.asarray(data)
+            except ValueError:
+                raise ValueError(_SHAPE_ERROR) from exc
+            raise
+        if array.ndim != 2 or array.size == 0:
+            raise ValueError(_SHAPE_ERROR)
+        # None silently converts to NaN, so only look for it if a NaN shows up.
+        if (
+            getattr(data, "dtype", object) == object
+            and array.dtype.kind in "fc"
+            and np.isnan(array.sum())
+            and any(value is None for row in data for value in row)
+            ):
+            raise TypeError("Matrix values must be numbers, not None")
+        self._set_data(array)
+
+    @classmethod
+    def _from_array(cls, array: np.ndarray) -> Pymatrix:
+        """
+        Wrap a 2D ndarray without validation or copying.
+
+        Intended for internal constructors whose arrays are already known
+        to be well-formed.
+        """
+        inst = cls.__new__(cls)
+        inst._set_data(array)
+        return inst
+
+    def _set_data(self, array: np.ndarray) -> None:
+        """
+        Store the array and update the shape attributes.
+
+        The matrix becomes the owner of a new alias group: a list of weak
+        references whose first entry is the owner, followed by the live
+        views and rows handed out over the same buffer.
+        """
+        self.data = array
+        self.rows, self.cols = array.shape
         self.shape = self.rows, self.cols
+        self._aliases = [weakref.ref(self)]
+
+    @property
+    def _layout(self) -> str | None:
+        """
+        Memory order of data: "C", "F", or None if it is not contiguous.
+
+        """
+        flags = self.data.flags
+        if flags.c_contiguous:
+            return "C"
+        return "F" if flags.f_contiguous else None
+
+    def _own_data(self) -> None:
+        """
+        Make in-place writes safe for every other alias of the buffer.
+
+        The owner makes its live views copy their data; a view with other
+        live aliases copies its own data instead.
+        """
+        aliases = self._aliases
+        aliases[1:] = [ref for ref in aliases[1:] if ref() is not None]
+        if aliases[0]() is self:
+            for ref in aliases[1:]:
+                view = ref()
+                if isinstance(view, Pymatrix):
+                    view._set_data(view.data.copy())
+            # Only rows of the owner itself keep following its writes.
+            aliases[1:] = [ref for ref in aliases[1:] if isinstance(ref(), np.ndarray)]
+        elif aliases[0]() is not None or len(aliases) > 2:
+            aliases[:] = [ref for ref in aliases if ref() is not self]
+            self._set_data(self.data.copy())
+        else:
+            # Nothing else sees this buffer any more, so take it over.
+            aliases[:] = [weakref.ref(self)]
+
+    def _derive(self, array: np.ndarray) -> Pymatrix:
+        """
+        Wrap a view of this matrix's data and track it as an alias.
+
+        """
+        aliases = self._aliases
+        aliases[1:] = [ref for ref in aliases[1:] if ref() is not None]
+        if any(isinstance(ref(), np.ndarray) for ref in aliases[1:]):
+            # A row handed out earlier could still write into the buffer.
+            return Pymatrix._from_array(array.copy())
+        inst = Pymatrix._from_array(array)
+        inst._aliases = aliases
+        aliases.append(weakref.ref(inst))
+        return inst
 
     @classmethod
-    def from_numpy(cls, ndarray: np.ndarray) -> Pymatrix:
+    def from_numpy(cls, ndarray: np.ndarray, dtype: DTypeLike = np.float64) -> Pymatrix:
         """
         Create a matrix from np.ndarray.
 
@@ -33,16 +170,27 @@ class Pymatrix:
         ----------
         ndarray : np.ndarray
             The matrix in numpy.ndarray format.
+        dtype : DTypeLike
+            Element type of the matrix.
 
         Returns
         -------
         Pymatrix
-            The matrix is identical to ndarray.
+            The matrix is identical to ndarray. A C-contiguous ndarray of
+            the requested dtype is wrapped without copying.
+
+        Raises
+        ------
+        ValueError
+            If ndarray is not a non-empty 2D array.
         """
-        return cls([ndarray[row, :].tolist() for row in range(len(ndarray))])
+        array = np.ascontiguousarray(ndarray, dtype=dtype)
+        if array.ndim != 2 or array.size == 0:
+            raise ValueError(_SHAPE_ERROR)
+        return cls._from_array(array)
 
     @classmethod
-    def zeros(cls, rows: int, cols: int) -> Pymatrix:
+    def zeros(cls, rows: int, cols: int, dtype: DTypeLike = np.float64) -> Pymatrix:
         """
         Create a matrix filled with zeros.
 
@@ -52,19 +200,25 @@ class Pymatrix:
             Number of rows.
         cols : int
             Number of columns.
+        dtype : DTypeLike
+            Element type of the matrix.
 
         Returns
         -------
         Pymatrix
             A matrix of zeros.
         """
-        return cls([[0.0] * cols for _ in range(rows)])
+        return cls._from_array(np.zeros((rows, cols), dtype=dtype))
 
     @classmethod
-    def random(cls, rows: int, cols: int, min_val=0.0, max_val=1.0) -> Pymatrix:
+    def random(
+            cls, rows: int, cols: int, min_val=0.0, max_val=1.0, dtype: DTypeLike = np.float64
+            ) -> Pymatrix:
         """
         Create a matrix filled with random float values.
 
+        Values are drawn from the module generator, see seed().
+
         Parameters
         ----------
         rows : int
@@ -75,51 +229,108 @@ class Pymatrix:
             Minimum random value.
         max_val : float
             Maximum random value.
+        dtype : DTypeLike
+            Element type of the matrix.
 
         Returns
         -------
         Pymatrix
             A matrix with random float values.
         """
-        return cls(
-            [[random.uniform(min_val, max_val) for _ in range(cols)] for _ in range(rows)]
-            )
+        if np.dtype(dtype) in _GENERATOR_DTYPES:
+            data = _rng.random((rows, cols), dtype=dtype)
+            data *= max_val - min_val
+            data += min_val
+            return cls._from_array(data)
+        data = _rng.uniform(min_val, max_val, (rows, cols))
+        return cls._from_array(data.astype(dtype, copy=False))
+
+    @classmethod
+    def randn(
+            cls, rows: int, cols: int, mean=0.0, std=1.0, dtype: DTypeLike = np.float64
+            ) -> Pymatrix:
+        """
+        Create a matrix filled with normally distributed float values.
+
+        Values are drawn from the module generator, see seed().
 
-    def __getitem__(self, idx: int | tuple[int, int]) -> float | list[float] | Pymatrix:
+        Parameters
+        ----------
+        rows : int
+            Number of rows.
+        cols : int
+            Number of columns.
+        mean : float
+            Mean of the distribution.
+        std : float
+            Standard deviation of the distribution.
+        dtype : DTypeLike
+            Element type of the matrix.
+
+        Returns
+        -------
+        Pymatrix
+            A matrix with normally distributed float values.
+
+        Raises
+        ------
+        ValueError
+            If std is negative.
+        """
+        if np.dtype(dtype) in _GENERATOR_DTYPES:
+            # standard_normal does not validate the scale like normal does.
+            if std < 0:
+                raise ValueError("scale < 0")
+            data = _rng.standard_normal((rows, cols), dtype=dtype)
+            data *= std
+            data += mean
+            return cls._from_array(data)
+        data = _rng.normal(mean, std, (rows, cols))
+        return cls._from_array(data.astype(dtype, copy=False))
+
+    def __getitem__(self, idx: int | tuple[int, int]) -> float | np.ndarray | Pymatrix:
         """
         Get a matrix element, row, column, or submatrix using indexing or slicing.
 
+        A submatrix is a view like transpose() returns, and rows and
+        columns are ndarray views of this matrix (see the class notes).
+
         Parameters
         ----------
         idx : int | tuple[int | slice, int | slice]
  
         Returns
         -------
-        : float | list[float] | Pymatrix
+        : float | np.ndarray | Pymatrix
             The requested element, row/column, or submatrix.
+
+        Raises
+        ------
+        ValueError
+            If a 2D selection has no elements, since matrices are non-empty.
         """
-        if isinstance(idx, tuple):
-            row_idx, col_idx = idx
-            
-            # Returns a number (float).
-            if isinstance(row_idx, int) and isinstance(col_idx, int):
-                return self.data[row_idx][col_idx]
-            
-            # Returns a slice (Pymatrix).
-            rows = self.data[row_idx]
-            if isinstance(rows[0], list):
-                sliced = [row[col_idx] for row in rows]
-            else:
-                sliced = rows[col_idx]
-            return Pymatrix(sliced)
-        
-        # Returns a row (list).
-        return self.data[idx]
+        # A number (float), a row/column (np.ndarray) or a slice (Pymatrix).
+        result = self.data[idx]
+        ndim = getattr(result, "ndim", 0)
+        if ndim == 2 and result.size == 0:
+            raise ValueError("Slice selects an empty submatrix")
+        if ndim == 0 or not np.may_share_memory(result, self.data):
+            return Pymatrix._from_array(result) if ndim == 2 else result
+        if ndim == 2:
+            return self._derive(result)
+        # The row can be written through, so detach other aliases first.
+        self._own_data()
+        result = self.data[idx]
+        self._aliases.append(weakref.ref(result))
+        return result
 
     def __setitem__(self, idx: int, value: list[float]) -> None:
         """
         Set a row by index.
 
+        Transposes and submatrices sharing the buffer are detached first,
+        so they are left unchanged.
+
         Parameters
         ----------
         idx : int
@@ -134,6 +345,7 @@ class Pymatrix:
         """
         if len(value) != self.cols:
             raise ValueError("Invalid row size")
+        self._own_data()
         self.data[idx] = value
 
     def __repr__(self) -> str:
@@ -141,38 +353,114 @@ class Pymatrix:
         Return the official string representation of the matrix.
 
         """
-        rows_str = []
-        for row in self.data:
-            formatted_row = ", ".join(f"{val:3g}" for val in row)
-            rows_str.append(f"[{formatted_row}]")
-        whitespace = len("Pymatrix([") * " "
-
-        return f"Pymatrix([" + str("," + "\n" + whitespace).join(rows_str) + "])"
+        body = np.array2string(self.data, separator=", ", prefix="Pymatrix(")
+        return f"Pymatrix({body})"
 
     def __str__(self) -> str:
         """
         Return a nicely formatted string of the matrix content.
         
         """
-        rows_str = []
-        for row in self.data:
-            formatted_row = ", ".join(f"{val:3g}" for val in row)
-            rows_str.append(f"[{formatted_row}]")
-        whitespace = len("[") * " "
-
-        return f"[" + str("\n" + whitespace).join(rows_str) + "]"
+        return np.array2string(self.data)
 
     def transpose(self) -> Pymatrix:
         """
         Return the transpose of the matrix.
 
+        The result shares memory with this matrix, only the strides (and
+        therefore the layout) are swapped. Copy-on-write keeps the two
+        independent (see the class notes).
+
         Returns
         -------
         Pymatrix
             Transposed matrix.
         """
-        transposed = list(zip(*self.data))
-        return Pymatrix([list(row) for row in transposed])
+        return self._derive(self.data.T)
+
+    def __matmul__(self, other: Pymatrix) -> Pymatrix:
+        """
+        Multiply two matrices.
+
+        The product is computed by BLAS through NumPy.
+
+        Parameters
+        ----------
+        other : Pymatrix
+            Right-hand matrix with as many rows as this matrix has columns.
+
+        Returns
+        -------
+        Pymatrix
+            The matrix product.
+
+        Raises
+        ------
+        ValueError
+            If the inner dimensions do not match.
+        """
+        if not isinstance(other, Pymatrix):
+            return NotImplemented
+        if self.cols != other.rows:
+            raise ValueError("Invalid matrix sizes for multiplication")
+        return Pymatrix._from_array(self.data @ other.data)
+
+    def _inplace(self, ufunc: np.ufunc, other: Pymatrix | float) -> Pymatrix:
+        """
+        Apply a binary ufunc in place, writing into this matrix's data.
+
+        Parameters
+        ----------
+        ufunc : np.ufunc
+            Elementwise operation, e.g. np.add.
+        other : Pymatrix | float
+            Matrix of the same shape, or a scalar.
+
+        Returns
+        -------
+        Pymatrix
+            This matrix, updated without allocating a new one (unless it
+            shares memory, see __setitem__).
+
+        Raises
+        ------
+        ValueError
+            If other is neither a scalar nor a matrix of the same shape.
+        """
+        operand = other.data if isinstance(other, Pymatrix) else other
+        if np.shape(operand) not in ((), self.shape):
+            raise ValueError("Invalid matrix size")
+        self._own_data()
+        ufunc(self.data, operand, out=self.data)
+        return self
+
+    def __iadd__(self, other: Pymatrix | float) -> Pymatrix:
+        """
+        Add another matrix or a scalar in place.
+
+        """
+        return self._inplace(np.add, other)
+
+    def __isub__(self, other: Pymatrix | float) -> Pymatrix:
+        """
+        Subtract another matrix or a scalar in place.
+
+        """
+        return self._inplace(np.subtract, other)
+
+    def __imul__(self, other: Pymatrix | float) -> Pymatrix:
+        """
+        Multiply elementwise by another matrix or a scalar in place.
+
+        """
+        return self._inplace(np.multiply, other)
+
+    def __itruediv__(self, other: Pymatrix | float) -> Pymatrix:
+        """
+        Divide elementwise by another matrix or a scalar in place.
+
+        """
+        return self._inplace(np.divide, other)
 
     def copy(self) -> Pymatrix:
         """
@@ -183,7 +471,7 @@ class Pymatrix:
         Pymatrix
             A new matrix with copied data.
         """
-        return Pymatrix([row[:] for row in self.data])
+        return Pymatrix._from_array(self.data.copy())
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -199,6 +487,11 @@ class Pymatrix:
         bool
             True if equal, False otherwise.
         """
-        if not isinstance(other, Pymatrix):
-            return False
-        return self.data == other.data
\ No newline at end of file
+        return (
+            isinstance(other, Pymatrix)
+            and self.data.shape == other.data.shape
+            and np.array_equal(self.data, other.data)
+            )
+
+    # Matrices are mutable, so equality must not come with hashing.
+    __hash__ = None
\ No newline at end of file
@@ -0,0 +1,333 @@
+import array
+
+import numpy as np
+import pytest
+
+from numpython import base
+from numpython.base import Pymatrix
+
+
+def test_init_stores_ndarray():
+    m = Pymatrix([[1, 2, 3], [4, 5, 6]])
+    assert m.shape == (2, 3)
+    assert isinstance(m.data, np.ndarray)
+    assert m.data.dtype == np.float64
+
+
+@pytest.mark.parametrize("data", [[], [[]], [1, 2]])
+def test_init_rejects_empty_or_flat(data):
+    with pytest.raises(ValueError, match="same length"):
+        Pymatrix(data)
+
+
+def test_zeros():
+    assert Pymatrix.zeros(2, 3) == Pymatrix([[0, 0, 0], [0, 0, 0]])
+
+
+def test_transpose():
+    m = Pymatrix([[1, 2, 3], [4, 5, 6]])
+    assert m.transpose() == Pymatrix([[1, 4], [2, 5], [3, 6]])
+
+
+def test_copy_is_independent():
+    m = Pymatrix([[1, 2], [3, 4]])
+    c = m.copy()
+    c[0] = [0, 0]
+    assert c == Pymatrix([[0, 0], [3, 4]])
+    assert m == Pymatrix([[1, 2], [3, 4]])
+
+
+def test_getitem():
+    m = Pymatrix([[1, 2, 3], [4, 5, 6]])
+    assert m[1, 2] == 6
+    np.testing.assert_array_equal(m[1], [4, 5, 6])
+    assert m[:, 1:] == Pymatrix([[2, 3], [5, 6]])
+
+
+def test_setitem_checks_row_size():
+    m = Pymatrix([[1, 2], [3, 4]])
+    m[1] = [5, 6]
+    assert m == Pymatrix([[1, 2], [5, 6]])
+    with pytest.raises(ValueError):
+        m[0] = [1, 2, 3]
+
+
+def test_transpose_flips_layout_without_copy():
+    m = Pymatrix([[1, 2, 3], [4, 5, 6]])
+    t = m.transpose()
+    assert np.shares_memory(t.data, m.data)
+    assert m._layout == "C" and t._layout == "F"
+    assert not t.data.flags.c_contiguous
+    np.testing.assert_array_equal(m[:, 1], [2, 5])
+
+
+def test_layout_follows_contiguity():
+    m = Pymatrix([[1, 2, 3], [4, 5, 6]])
+    strided = m[:, ::2]
+    assert not strided.data.flags.c_contiguous
+    assert strided._layout is None
+    assert Pymatrix([[1, 2, 3]]).transpose()._layout == "C"
+
+
+def test_matmul_matches_numpy():
+    a = Pymatrix.random(5, 3)
+    b = Pymatrix.random(3, 4)
+    np.testing.assert_allclose((a @ b).data, a.data @ b.data)
+    with pytest.raises(ValueError):
+        a @ a
+
+
+@pytest.mark.parametrize("rows, inner, cols", [(2, 2, 2), (40, 40, 40), (8, 400, 3)])
+def test_matmul_matches_numpy_across_sizes(rows, inner, cols):
+    a = Pymatrix.random(rows, inner)
+    b = Pymatrix.random(inner, cols)
+    np.testing.assert_allclose((a @ b).data, a.data @ b.data)
+
+
+def test_from_numpy_wraps_contiguous_float64_without_copy():
+    a = np.arange(6.0).reshape(2, 3)
+    assert Pymatrix.from_numpy(a).data is a
+    f = Pymatrix.from_numpy(np.asfortranarray(a))
+    assert f.data.flags.c_contiguous
+    assert f == Pymatrix.from_numpy(a)
+    assert Pymatrix.from_numpy(np.arange(4).reshape(2, 2)).data.dtype == np.float64
+
+
+@pytest.mark.parametrize("ndarray", [np.arange(3.0), np.float64(1.0), np.zeros((0, 2))])
+def test_from_numpy_rejects_non_matrix_input(ndarray):
+    with pytest.raises(ValueError, match="same length"):
+        Pymatrix.from_numpy(ndarray)
+
+
+def test_random_within_bounds():
+    m = Pymatrix.random(50, 40, -2.0, 3.0)
+    assert m.shape == (50, 40)
+    assert m.data.min() >= -2.0 and m.data.max() < 3.0
+
+
+def test_eq_compares_type_and_shape():
+    assert Pymatrix([[1, 2]]) != Pymatrix([[1], [2]])
+    assert Pymatrix([[1, 2]]) != [[1, 2]]
+
+
+def test_matrices_are_unhashable():
+    with pytest.raises(TypeError):
+        hash(Pymatrix([[1]]))
+
+
+def test_copy_owns_contiguous_data():
+    t = Pymatrix([[1, 2], [3, 4]]).transpose()
+    c = t.copy()
+    assert c == t
+    assert c.data.flags.owndata and c.data.flags.c_contiguous
+
+
+def test_getitem_wraps_only_2d_results():
+    m = Pymatrix([[1, 2, 3], [4, 5, 6]])
+    assert isinstance(m[0, 0], float)
+    assert isinstance(m[:, 0], np.ndarray)
+    assert isinstance(m[0:1, :], Pymatrix)
+    assert m[[1, 0]] == Pymatrix([[4, 5, 6], [1, 2, 3]])
+
+
+def test_from_array_wraps_without_validation():
+    a = np.ones((2, 3))
+    m = Pymatrix._from_array(a)
+    assert m.data is a
+    assert m.shape == (2, 3)
+
+
+def test_repr_and_str():
+    m = Pymatrix([[1, 2], [3, 4]])
+    assert repr(m) == "Pymatrix([[1., 2.],\n          [3., 4.]])"
+    assert str(m) == "[[1. 2.]\n [3. 4.]]"
+
+
+def test_randn_statistics():
+    m = Pymatrix.randn(300, 300, 2.0, 3.0)
+    assert abs(m.data.mean() - 2.0) < 0.1
+    assert abs(m.data.std() - 3.0) < 0.1
+
+
+def test_slots_prevent_new_attributes():
+    m = Pymatrix([[1]])
+    assert not hasattr(m, "__dict__")
+    with pytest.raises(AttributeError):
+        m.extra = 1
+
+
+def test_inplace_ops_match_numpy():
+    a = np.arange(1.0, 7.0).reshape(2, 3)
+    m = Pymatrix(a.copy())
+    data = m.data
+    m += Pymatrix(a.copy())
+    m -= 1
+    m *= Pymatrix(a.copy())
+    m /= 2
+    np.testing.assert_allclose(m.data, (a + a - 1) * a / 2)
+    assert m.data is data
+
+
+def test_init_accepts_array_rows():
+    rows = [array.array("d", [1, 2]), array.array("d", [3, 4])]
+    assert Pymatrix(rows) == Pymatrix([[1, 2], [3, 4]])
+
+
+def test_init_reports_ragged_rows():
+    with pytest.raises(ValueError, match="same length"):
+        Pymatrix([[1], [1, 2]])
+
+
+def test_dtype_is_kept():
+    f = np.float32
+    matrices = [
+        Pymatrix([[1, 2]], f),
+        Pymatrix.from_numpy(np.ones((2, 2)), f),
+        Pymatrix.zeros(2, 2, f),
+        Pymatrix.random(2, 2, dtype=f),
+        Pymatrix.randn(2, 2, dtype=f),
+        ]
+    assert all(m.data.dtype == f for m in matrices)
+    a = Pymatrix.random(3, 4, dtype=f)
+    assert (a @ Pymatrix.randn(4, 2, dtype=f)).data.dtype == f
+    a += 1.5
+    assert a.data.dtype == f
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float16])
+def test_random_respects_bounds_and_std_for_any_dtype(dtype):
+    m = Pymatrix.random(50, 40, -2.0, 3.0, dtype=dtype)
+    assert m.data.dtype == dtype
+    assert m.data.min() >= -2.0 and m.data.max() <= 3.0
+    with pytest.raises(ValueError):
+        Pymatrix.randn(2, 2, 0.0, -1.0, dtype=dtype)
+
+
+def test_init_converts_to_dtype_in_one_pass():
+    m = Pymatrix([[1, 2], [3, 4]], np.float32)
+    assert m.data.dtype == np.float32 and m.data.flags.owndata
+    with pytest.raises(TypeError, match="None"):
+        Pymatrix([[1, None]], np.float32)
+    assert np.isnan(Pymatrix([[1, float("nan")]]).data[0, 1])
+
+
+def test_write_to_transpose_leaves_source_unchanged():
+    m = Pymatrix([[1, 2], [3, 4]])
+    t = m.transpose()
+    t[0] = [0, 0]
+    assert t == Pymatrix([[0, 0], [2, 4]])
+    assert m == Pymatrix([[1, 2], [3, 4]])
+    t = m.transpose()
+    t += 1
+    assert m == Pymatrix([[1, 2], [3, 4]])
+
+
+def test_own_data_materializes_view():
+    m = Pymatrix.random(3, 2)
+    t = m.transpose()
+    t._own_data()
+    assert t.data.flags.owndata and t.data.flags.c_contiguous
+    assert t._layout == "C"
+    np.testing.assert_array_equal(t.data, m.data.T)
+
+
+def test_seed_makes_random_reproducible():
+    base.seed(42)
+    first = Pymatrix.random(3, 3), Pymatrix.randn(3, 3)
+    base.seed(42)
+    assert first == (Pymatrix.random(3, 3), Pymatrix.randn(3, 3))
+
+
+def test_randn_rejects_negative_std():
+    with pytest.raises(ValueError):
+        Pymatrix.randn(2, 2, 0.0, -1.0)
+
+
+def test_write_to_source_leaves_transpose_unchanged():
+    m = Pymatrix([[1, 2], [3, 4]])
+    t = m.transpose()
+    m[0] = [9, 9]
+    assert t == Pymatrix([[1, 3], [2, 4]])
+    m += 1
+    assert t == Pymatrix([[1, 3], [2, 4]])
+
+
+def test_submatrix_copy_on_write():
+    m = Pymatrix([[1, 2], [3, 4]])
+    s = m[0:1, :]
+    m[0] = [7, 7]
+    assert s == Pymatrix([[1, 2]])
+    s = m[0:1, :]
+    s[0] = [5, 5]
+    assert m == Pymatrix([[7, 7], [3, 4]])
+
+
+def test_reading_submatrix_keeps_rows_writable():
+    m = Pymatrix([[1, 2], [3, 4]])
+    s = m[0:1, :]
+    m[0][1] = 9
+    assert m == Pymatrix([[1, 9], [3, 4]])
+    assert s == Pymatrix([[1, 2]])
+
+
+def test_empty_submatrix_is_rejected():
+    m = Pymatrix([[1, 2], [3, 4]])
+    with pytest.raises(ValueError, match="empty"):
+        m[0:0, :]
+
+
+def test_inplace_ops_reject_shape_mismatch():
+    m = Pymatrix.zeros(3, 3)
+    with pytest.raises(ValueError):
+        m += Pymatrix([[1, 2, 3]])
+    with pytest.raises(ValueError):
+        m *= np.ones(3)
+
+
+def test_init_reports_conversion_errors():
+    with pytest.raises(ValueError, match="could not convert"):
+        Pymatrix([["a", "b"]])
+    with pytest.raises(TypeError):
+        Pymatrix([[1, object()]])
+    with pytest.raises(TypeError, match="None"):
+        Pymatrix([[1, None]])
+
+
+def test_rows_of_transposed_matrix_do_not_write_through():
+    m = Pymatrix([[1, 2], [3, 4]])
+    t = m.transpose()
+    t[0][1] = 100
+    assert t == Pymatrix([[1, 100], [2, 4]])
+    assert m == Pymatrix([[1, 2], [3, 4]])
+
+
+def test_rows_stay_writable_after_transpose_or_slice():
+    m = Pymatrix([[1, 2], [3, 4]])
+    t = m.transpose()
+    m[0][1] = 5
+    s = m[0:1, :]
+    m[1][0] = 6
+    assert m == Pymatrix([[1, 5], [6, 4]])
+    assert t == Pymatrix([[1, 3], [2, 4]])
+    assert s == Pymatrix([[1, 5]])
+
+
+def test_row_taken_before_transpose_does_not_reach_it():
+    m = Pymatrix([[1, 2], [3, 4]])
+    r = m[0]
+    t = m.transpose()
+    r[1] = 100
+    assert m == Pymatrix([[1, 100], [3, 4]])
+    assert t == Pymatrix([[1, 3], [2, 4]])
+
+
+def test_transpose_does_not_change_source_aliasing():
+    a = np.zeros((2, 2))
+    p = Pymatrix.from_numpy(a)
+    p.transpose()
+    p += 1
+    np.testing.assert_array_equal(a, np.ones((2, 2)))
+    t = p.transpose()
+    p += 1
+    np.testing.assert_array_equal(a, np.full((2, 2), 2.0))
+    assert t == Pymatrix(np.ones((2, 2)))